@@ -155,6 +155,44 @@ impl Explorerd {
             None => Ok(JsonValue::Array(vec![])),
         }
     }
+
+    // RPCAPI:
+    // Queries the database to retrieve the block corresponding to the provided hash, together
+    // with its transactions, sparing clients a second round trip.
+    // Returns the readable block and its readable transactions upon success.
+    //
+    // **Params:**
+    // * `array[0]`: `String` Block header hash
+    //
+    // **Returns:**
+    // * Array of the `BlockRecord` and the array of its `TransactionRecord` encoded into a JSON,
+    //   or an empty array if the block is not found.
+    //
+    // **Example API Usage:**
+    // --> {"jsonrpc": "2.0", "method": "blocks.get_block_with_transactions", "params": ["5cc...2f9"], "id": 1}
+    // <-- {"jsonrpc": "2.0", "result": [{...}, [...]], "id": 1}
+    pub async fn blocks_get_block_with_transactions(
+        &self,
+        params: &JsonValue,
+    ) -> Result<JsonValue> {
+        // Extract header hash
+        let header_hash = parse_json_array_string("header_hash", 0, params)?;
+
+        // Fetch the block, returning an empty array if not found
+        let block = match self.service.get_block_by_hash(&header_hash)? {
+            Some(block) => block,
+            None => return Ok(JsonValue::Array(vec![])),
+        };
+
+        // Retrieve the block transactions
+        let transactions = self.service.get_transactions_by_header_hash(&header_hash)?;
+
+        // Transform block and transactions to `JsonValue` and return result
+        Ok(JsonValue::Array(vec![
+            block.to_json_array(),
+            JsonValue::Array(transactions.iter().map(|tx| tx.to_json_array()).collect()),
+        ]))
+    }
 }
 
 #[cfg(test)]
@@ -307,4 +345,20 @@ mod tests {
             validate_invalid_rpc_header_hash(&explorerd, rpc_method);
         });
     }
+    #[test]
+    /// Tests the handling of invalid parameters for the `blocks.get_block_with_transactions`
+    /// JSON-RPC method. Verifies that an invalid `header_hash` value, either a numeric type or
+    /// invalid hash string, results in appropriate error.
+    fn test_blocks_get_block_with_transactions_invalid_params() {
+        smol::block_on(async {
+            // Define the RPC method name
+            let rpc_method = "blocks.get_block_with_transactions";
+
+            // Set up the explorerd
+            let explorerd = setup();
+
+            // Validate when provided with an invalid header hash
+            validate_invalid_rpc_header_hash(&explorerd, rpc_method);
+        });
+    }
 }
@@ -100,6 +100,9 @@ impl RequestHandler<()> for Explorerd {
                 self.blocks_get_blocks_in_heights_range(params).await
             }
             "blocks.get_block_by_hash" => self.blocks_get_block_by_hash(params).await,
+            "blocks.get_block_with_transactions" => {
+                self.blocks_get_block_with_transactions(params).await
+            }
 
             // =====================
             // Transactions methods
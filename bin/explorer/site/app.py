@@ -18,7 +18,7 @@
 """
 Module: app.py
 
-This module initializes the DarkFi explorer Flask application by registering various blueprints for handling routes
+This module initializes the DarkFi explorer Quart application by registering various blueprints for handling routes
 related to blocks, contracts, transactions, search, and the explore section, including the home page. It also defines
 error handlers, ensuring appropriate responses for these common HTTP errors.
 """
@@ -26,7 +26,7 @@ error handlers, ensuring appropriate responses for these common HTTP errors.
 import os
 import tomli
 
-from flask import Flask, render_template
+from quart import Quart, render_template
 
 from blueprints.explore import explore_bp
 from blueprints.block import block_bp
@@ -37,14 +37,14 @@ import log
 
 def create_app():
     """
-    Creates and configures the DarkFi explorer Flask application.
+    Creates and configures the DarkFi explorer Quart application.
 
-    This function creates and initializes the explorer the Flask app,
+    This function creates and initializes the explorer the Quart app,
     registering applicable blueprints for handling explorer-related routes,
     and defining error handling for common HTTP errors. It returns a fully
-    configured Flask application instance.
+    configured Quart application instance.
     """
-    app = Flask(__name__)
+    app = Quart(__name__)
 
     # Retrieve and store network
     network = os.getenv("FLASK_ENV", "localnet")
@@ -62,27 +62,53 @@ def create_app():
     app.register_blueprint(contract_bp)
     app.register_blueprint(transaction_bp)
 
+    # Rendered error pages, keyed by status code
+    error_pages = {}
+
+    async def error_page(code):
+        """
+        Returns the rendered error page for the given status code, rendering
+        its template only the first time it is requested.
+
+        Args:
+            code: The HTTP status code of the error page.
+        """
+        if code not in error_pages:
+            error_pages[code] = await render_template(f'{code}.html')
+        return error_pages[code]
+
+    @app.before_serving
+    async def render_error_pages():
+        """
+        Renders the static 404 and 500 error pages once before serving requests,
+        so error handlers do not render templates on every error. Servers running
+        without lifespan events skip this, and pages are rendered on first error.
+        """
+        async with app.test_request_context("/"):
+            await error_page(404)
+            await error_page(500)
+
     # Define page not found error handler
     @app.errorhandler(404)
-    def page_not_found(e):
+    async def page_not_found(e):
         """
-        Handles 404 errors by rendering a custom 404 error page when a requested page is not found,
-        returning a rendered template along with a 404 status code.
+        Handles 404 errors by returning the custom 404 error page, rendered once, when a requested
+        page is not found, along with a 404 status code.
 
         Args:
             e: The error object associated with the 404 error.
         """
-        # Render the custom 404 error page
-        return render_template('404.html'), 404
+        # Return the custom 404 error page
+        return await error_page(404), 404
 
     # Define internal server error handler
     @app.errorhandler(500)
-    def internal_server_error(e):
+    async def internal_server_error(e):
         """
         Handles 500 errors by logging the error and returning the app's 500 error page.
 
         This function logs the error with its stack trace, file name, and line number
-        to help with debugging. It then renders the '500.html' template and returns it
+        to help with debugging. It then returns the '500.html' page, rendered once,
         along with a 500 HTTP status code.
 
         Args:
@@ -91,8 +117,8 @@ def create_app():
         # Log the error
         app.error_logger.exception("An unexpected error occurred")
 
-        # Render the custom 500 error page
-        return render_template('500.html'), 500
+        # Return the custom 500 error page
+        return await error_page(500), 500
 
     # Log that we started the site
     app.logger.info("=" * 60)
@@ -110,7 +136,7 @@ def load_toml_config(app, network="localnet", config_path="site_config.toml"):
     Loads environment-specific key-value pairs from a TOML configuration file into `app.config`.
 
     Args:
-        app (Flask): The Flask application.
+        app (Quart): The Quart application.
         network (str): The name of the network section to load (default is "localnet").
         config_path (str): The path to the TOML configuration file.
 
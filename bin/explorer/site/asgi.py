@@ -16,10 +16,11 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 """
-Module: wsgi.py
+Module: asgi.py
 
-This module acts as the entry point for the Gunicorn server to run the Flask application.
-It initializes and exposes the Flask application created by the `create_app()` factory
+This module acts as the ASGI entry point for the Gunicorn server, running the Quart application
+on Uvicorn workers.
+It initializes and exposes the Quart application created by the `create_app()` factory
 function from the `app` module.
 """
 
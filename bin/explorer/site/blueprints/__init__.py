@@ -19,7 +19,7 @@
 Explorer blueprint package initializer.
 
 This module imports and exposes blueprints for used by the explorer
-flask application.
+Quart application.
 
 Exposed Blueprints:
     - explore_bp: The explorer application blueprint.
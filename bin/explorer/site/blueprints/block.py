@@ -18,11 +18,11 @@
 """
 Blueprint: block_bp
 
-This module defines a Flask blueprint (`block_bp`) for handling block-related functionality,
-serving as a primary location for Flask code related to routes and features associated with blocks.
+This module defines a Quart blueprint (`block_bp`) for handling block-related functionality,
+serving as a primary location for Quart code related to routes and features associated with blocks.
 """
 
-from flask import Blueprint, render_template
+from quart import Blueprint, render_template
 
 import rpc
 
@@ -38,11 +38,8 @@ async def block(header_hash):
     Path Args:
         header_hash (str): The header hash of the block to retrieve.
     """
-    # Fetch the block details
-    block = await rpc.get_block(header_hash)
-
-    # Fetch transactions associated with the block
-    transactions = await rpc.get_block_transactions(header_hash)
+    # Fetch the block details along with its associated transactions
+    block, transactions = await rpc.get_block_with_transactions(header_hash)
 
     # Render the template with the block details and associated transactions
-    return render_template('block.html', block=block, transactions=transactions)
+    return await render_template('block.html', block=block, transactions=transactions)
@@ -18,11 +18,11 @@
 """
 Blueprint: contract_bp
 
-This module defines a Flask blueprint (`contract_bp`) for handling contract-related functionality,
-serving as a primary location for Flask code related to routes and related features associated with contracts.
+This module defines a Quart blueprint (`contract_bp`) for handling contract-related functionality,
+serving as a primary location for Quart code related to routes and related features associated with contracts.
 """
 
-from flask import request, render_template, Blueprint
+from quart import request, render_template, Blueprint
 
 from pygments import highlight
 from pygments.lexers import RustLexer
@@ -53,7 +53,7 @@ async def contract_source_list(contract_id):
     source_paths = await rpc.get_contract_source_paths(contract_id)
 
     # Returned rendered contract source list
-    return render_template('contract_source_list.html', contract_id=contract_id, source_paths=source_paths, contract_name=contract_name)
+    return await render_template('contract_source_list.html', contract_id=contract_id, source_paths=source_paths, contract_name=contract_name)
 
 @contract_bp.route('/contract/source/<contract_id>/<path:source_path>')
 async def contract_source(contract_id, source_path):
@@ -83,7 +83,7 @@ async def contract_source(contract_id, source_path):
     pygments_css = formatter.get_style_defs()
 
     # Returned rendered contract source code page
-    return render_template(
+    return await render_template(
         'contract_source.html',
         source=source,
         contract_id=contract_id,
@@ -18,11 +18,13 @@
 """
 Blueprint: explorer_bp
 
-This module defines a Flask blueprint (`explore_bp`) for managing the general functionality of the explorer application.
-It serves as the primary location for Flask routes related to the home page, search functionality, and other general features.
+This module defines a Quart blueprint (`explore_bp`) for managing the general functionality of the explorer application.
+It serves as the primary location for Quart routes related to the home page, search functionality, and other general features.
 """
 
-from flask import Blueprint, render_template, request
+import asyncio
+
+from quart import Blueprint, render_template, request
 
 import rpc
 
@@ -38,14 +40,14 @@ async def index():
     Upon success, it returns a rendered template with recent blocks, basic statistics,
     latest metric statistics (if available), and native contracts.
     """
-    # Fetch the latest 10 blocks
-    blocks = await rpc.get_last_n_blocks(10)
-
-    # Retrieve basic statistics summarizing the overall chain data
-    basic_stats = await rpc.get_basic_statistics()
-
-    # Fetch the metric statistics
-    metric_stats = await rpc.get_metric_statistics()
+    # Concurrently fetch the latest 10 blocks, basic statistics summarizing the overall
+    # chain data, metric statistics, and the native contracts
+    blocks, basic_stats, metric_stats, native_contracts = await asyncio.gather(
+        rpc.get_last_n_blocks(10),
+        rpc.get_basic_statistics(),
+        rpc.get_metric_statistics(),
+        rpc.get_native_contracts(),
+    )
 
     # Determine if metrics exist
     has_metrics = metric_stats and isinstance(metric_stats, list)
@@ -53,11 +55,8 @@ async def index():
     # Get the latest metric statistics or return empty metrics
     latest_metric_stats = metric_stats[-1] if has_metrics else [0] * 15
 
-    # Retrieve the native contracts
-    native_contracts = await rpc.get_native_contracts()
-
     # Render the explorer home page
-    return render_template(
+    return await render_template(
         'index.html',
         blocks=blocks,
         basic_stats=basic_stats,
@@ -79,16 +78,13 @@ async def search():
     # Get the search hash
     search_hash = request.args.get('search_hash', '')
 
-    # Fetch the block corresponding to the search hash
-    block = await rpc.get_block(search_hash)
-
-    # Fetch transactions associated with the block
-    transactions = await rpc.get_block_transactions(search_hash)
+    # Fetch the block corresponding to the search hash along with its transactions
+    block, transactions = await rpc.get_block_with_transactions(search_hash)
 
     if transactions:
         # Render block details with associated transactions if found
-        return render_template('block.html', block=block, transactions=transactions)
+        return await render_template('block.html', block=block, transactions=transactions)
     else:
         # Fetch transaction details if no transactions are found for the block
         transaction = await rpc.get_transaction(search_hash)
-        return render_template('transaction.html', transaction=transaction)
\ No newline at end of file
+        return await render_template('transaction.html', transaction=transaction)
\ No newline at end of file
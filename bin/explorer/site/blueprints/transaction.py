@@ -18,11 +18,11 @@
 """
 Blueprint: transaction_bp
 
-This module defines a Flask blueprint (`transaction_bp`) for handling transaction-related functionality,
-serving as a primary location for Flask code related to routes and related features associated with transactions.
+This module defines a Quart blueprint (`transaction_bp`) for handling transaction-related functionality,
+serving as a primary location for Quart code related to routes and related features associated with transactions.
 """
 
-from flask import Blueprint, render_template
+from quart import Blueprint, render_template
 
 import rpc
 
@@ -42,4 +42,4 @@ async def transaction(transaction_hash):
     transaction = await rpc.get_transaction(transaction_hash)
 
     # Render the template using the fetched transaction details
-    return render_template('transaction.html', transaction=transaction)
+    return await render_template('transaction.html', transaction=transaction)
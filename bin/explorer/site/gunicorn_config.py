@@ -1,16 +1,15 @@
 ## explorer gunicorn configuration
+import multiprocessing
+import os
 
 # Bind address and port
 bind = "127.0.0.1:8000"
 
-# Number of worker processes
-workers = 1
-
-# Number of threads per worker
-threads = 2
+# Number of worker processes, one event loop per core by default
+workers = int(os.getenv("WORKERS", multiprocessing.cpu_count()))
 
-# Type of worker class
-worker_class = "gthread"
+# Type of worker class, ASGI worker serving the Quart application
+worker_class = "uvicorn.workers.UvicornWorker"
 
 # Maximum number of pending connections
 backlog = 2048
@@ -22,7 +21,6 @@ timeout = 30
 pidfile = "gunicorn.pid"
 
 # Log configuration
-import os
 environment = os.getenv("FLASK_ENV", "testnet")
 log_home = os.getenv("LOG_HOME", "/tmp")
 log_path = os.path.join(log_home, environment, "app.log")
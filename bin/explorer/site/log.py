@@ -23,17 +23,17 @@ from logging.handlers import RotatingFileHandler
 """
 Module: log.py
 
-This module provides functionality to setup logging for the explorer Flask application.
+This module provides functionality to setup logging for the explorer Quart application.
 """
 
 def setup_logger(app, env):
     """
-    Sets up logging for the explorer Flask app by setting up error, application, and request logging.
+    Sets up logging for the explorer Quart app by setting up error and application logging.
 
     The error logger captures application errors and logs them to a dedicated error log file. The application
-    logger handles general application-level logs such as debug or informational messages. Additionally, the
-    request logger, derived from the Werkzeug logger, manages HTTP request logs and directs them to the
-    same file as the application logger.
+    logger handles general application-level logs such as debug or informational messages. HTTP requests
+    served by the Quart development server are logged through the application logger as well, while
+    Gunicorn deployments write them to the access log configured in `gunicorn_config.py`.
 
     The overall log level is determined by the LOG_LEVEL environment variable, defaulting to INFO if the
     variable is not set or contains an invalid value. The path where logs are stored is obtained from the
@@ -41,7 +41,7 @@ def setup_logger(app, env):
     current directory.
 
     Args:
-        app (Flask): The Flask application instance.
+        app (Quart): The Quart application instance.
         env (str): The environment (e.g., 'localnet', 'mainnet', 'testnet', etc.).
     """
     log_path = app.config.get('log_path', '.')
@@ -70,10 +70,6 @@ def setup_logger(app, env):
     app_logger = setup_app_logger(log_path, env, log_level)
     app.logger = app_logger
 
-    # Request logger setup
-    app_log_file = os.path.join(log_path, 'app.log')
-    setup_request_logger(app_log_file, env, log_level)
-
     # Error logger setup
     error_logger = setup_error_logger(log_path, env)
     app.error_logger = error_logger
@@ -126,31 +122,6 @@ def setup_app_logger(log_path, env, log_level=logging.INFO):
 
     return app_logger
 
-def setup_request_logger(log_file, env, log_level=logging.INFO):
-    """
-    Configures the request logger to handle HTTP request logs based on the specified environment.
-
-    If the environment is set to 'localnet', HTTP requests are logged to the console to facilitate
-    local development and debugging. For all other environments, such as 'testnet' or 'mainnet',
-    HTTP requests are logged to the specified log file, ensuring that logs are persisted in a location
-    appropriate for testing or production use.
-
-    Args:
-        log_file (str): Path to the log file where HTTP requests should be logged.
-        env (str): The application environment (e.g., 'localnet', 'testnet', 'mainnet').
-        log_level (int): The logging level (default is INFO).
-    """
-    # Get the werkzeug logger that logs requests
-    request_logger = logging.getLogger('werkzeug')
-    request_logger.setLevel(log_level)
-    request_logger.propagate = False
-
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(log_level)
-    request_logger.addHandler(file_handler)
-
-    add_console_handler_if_localnet(env, request_logger, log_level)
-
 def initialize_log_handler(log_file, env):
     """
     Initializes and returns a log handler based on the environment.
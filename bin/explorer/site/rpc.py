@@ -20,12 +20,34 @@ Module: rpc.py
 
 This module provides an asynchronous interface for interacting with the DarkFi explorer daemon
 using JSON-RPC. It includes functionality to create a communication channel, send requests,
-and handle responses from the server.
+and handle responses from the server, caching responses that can be safely reused.
 """
 
 import asyncio, json, random
 
-from flask import abort, current_app
+from cachetools import TTLCache
+from quart import abort, current_app
+
+# Blocks and transactions can be rolled back by the explorer daemon on reorgs, so they are
+# only kept for a minute, and cleared as soon as a new chain tip is seen
+BLOCK_CACHE = TTLCache(maxsize=1024, ttl=60)
+TRANSACTION_CACHE = TTLCache(maxsize=4096, ttl=60)
+
+# Header hash of the last seen chain tip
+LAST_TIP_HASH = None
+
+# Chain summaries change every block, only coalesce bursts of home page loads
+SUMMARY_CACHE = TTLCache(maxsize=16, ttl=2)
+
+# JSON-RPC error code returned when the server does not provide the requested method
+METHOD_NOT_FOUND = -32601
+
+# Whether the explorer daemon provides `blocks.get_block_with_transactions`, unset upon
+# the first method not found error from an older daemon
+BLOCK_WITH_TRANSACTIONS_SUPPORTED = True
+
+class MethodNotFoundError(Exception):
+    """Exception raised when the JSON-RPC server does not provide the requested method."""
 
 class Channel:
     """Class representing the channel with the JSON-RPC server."""
@@ -71,11 +93,13 @@ async def create_channel(server_name, port):
     channel = Channel(reader, writer)
     return channel
 
-async def query(method, params):
+async def query(method, params, fallback_on_missing=False):
     """
      Execute a request towards the JSON-RPC server by constructing a JSON-RPC
      request and sending it to the server. It handles connection errors and server responses,
-     returning the result of the query or raising an error if the request fails.
+     returning the result of the query or raising an error if the request fails. When
+     `fallback_on_missing` is set, a method unknown to the server raises `MethodNotFoundError`
+     so callers can fall back to other methods.
     """
     # Create the channel to send RPC request
     channel = await create_channel(current_app.config['explorer_rpc_url'], current_app.config['explorer_rpc_port'])
@@ -102,34 +126,88 @@ async def query(method, params):
         error = response["error"]
         errcode, errmsg = error["code"], error["message"]
         print(f"error: {errcode} - {errmsg}")
+
+        # Let callers fall back to other methods supported by older servers
+        if fallback_on_missing and errcode == METHOD_NOT_FOUND:
+            raise MethodNotFoundError(method)
+
         abort(404)
 
     return response["result"]
 
+async def cached_query(cache, method, params, fallback_on_missing=False):
+    """
+     Execute a request towards the JSON-RPC server, serving it from the provided cache
+     when the same method and parameters were recently queried. Empty results are not
+     cached, since the requested data might not be synced by the explorer daemon yet.
+    """
+    key = (method, tuple(params))
+    if key in cache:
+        return cache[key]
+
+    result = await query(method, params, fallback_on_missing)
+    if result:
+        cache[key] = result
+    return result
+
+def clear_on_new_tip(blocks):
+    """
+     Clears cached blocks and transactions when the chain tip differs from the last seen one,
+     since previously cached entries might have been rolled back by a reorg.
+    """
+    global LAST_TIP_HASH
+
+    # Header hash is the first field of a block, height the fourth
+    tip_hash = max(blocks, key=lambda block: block[3])[0]
+    if tip_hash != LAST_TIP_HASH:
+        BLOCK_CACHE.clear()
+        TRANSACTION_CACHE.clear()
+        LAST_TIP_HASH = tip_hash
+
 async def get_last_n_blocks(n: str):
     """Retrieves the last n blocks."""
-    return await query("blocks.get_last_n_blocks", [n])
+    blocks = await cached_query(SUMMARY_CACHE, "blocks.get_last_n_blocks", [n])
+    if blocks:
+        clear_on_new_tip(blocks)
+    return blocks
 
 async def get_basic_statistics():
     """Retrieves basic statistics."""
-    return await query("statistics.get_basic_statistics", [])
+    return await cached_query(SUMMARY_CACHE, "statistics.get_basic_statistics", [])
 
 async def get_metric_statistics():
     """Retrieves metrics statistics."""
-    return await query("statistics.get_metric_statistics", [])
+    return await cached_query(SUMMARY_CACHE, "statistics.get_metric_statistics", [])
 
 async def get_block(header_hash: str):
     """Retrieves block information for a given header hash."""
-    return await query("blocks.get_block_by_hash", [header_hash])
+    return await cached_query(BLOCK_CACHE, "blocks.get_block_by_hash", [header_hash])
 
 async def get_block_transactions(header_hash: str):
     """Retrieves transactions associated with a given block header hash."""
-    return await query("transactions.get_transactions_by_header_hash", [header_hash])
+    return await cached_query(BLOCK_CACHE, "transactions.get_transactions_by_header_hash", [header_hash])
+
+
+async def get_block_with_transactions(header_hash: str):
+    """
+    Retrieves block information along with its associated transactions for a given header hash
+    in a single request, falling back to separate concurrent requests on older explorer daemons.
+    """
+    global BLOCK_WITH_TRANSACTIONS_SUPPORTED
+
+    if BLOCK_WITH_TRANSACTIONS_SUPPORTED:
+        try:
+            result = await cached_query(BLOCK_CACHE, "blocks.get_block_with_transactions", [header_hash], fallback_on_missing=True)
+            # An empty result is returned when the block is not found
+            return result if result else ([], [])
+        except MethodNotFoundError:
+            BLOCK_WITH_TRANSACTIONS_SUPPORTED = False
 
+    return await asyncio.gather(get_block(header_hash), get_block_transactions(header_hash))
 
 async def get_transaction(transaction_hash: str):
     """Retrieves transaction information for a given transaction hash."""
-    return await query("transactions.get_transaction_by_hash", [transaction_hash])
+    return await cached_query(TRANSACTION_CACHE, "transactions.get_transaction_by_hash", [transaction_hash])
 
 async def get_native_contracts():
     """Retrieves native contracts."""
@@ -4,6 +4,8 @@ from core.strategy import *
 class Darkie():
     def __init__(self, airdrop, initial_stake=None, vesting=[], hp=False, commit=True, epoch_len=EPOCH_LENGTH, strategy=random_strategy(EPOCH_LENGTH), idx=0):
         self.vesting = vesting
+        self.pool = None # DarkiePool holding stake, slot, won_hist once added to the table
+        self.pool_idx = -1
         self.stake = (Num(airdrop) if hp else airdrop)
         self.initial_stake = [self.stake]
         self.Sigma = None
@@ -22,6 +24,40 @@ class Darkie():
     def clone(self):
         return Darkie(self.stake)
 
+    """
+    stake, slot, and winning history are read from the pool arrays once the darkie
+    is pooled, and from the darkie itself otherwise.
+    """
+    @property
+    def stake(self):
+        return self._stake if self.pool is None else self.pool.stake[self.pool_idx]
+
+    @stake.setter
+    def stake(self, value):
+        if self.pool is None:
+            self._stake = value
+        else:
+            self.pool.stake[self.pool_idx] = value
+
+    @property
+    def slot(self):
+        return self._slot if self.pool is None else int(self.pool.slots[self.pool_idx])
+
+    @slot.setter
+    def slot(self, value):
+        if self.pool is None:
+            self._slot = value
+        else:
+            self.pool.slots[self.pool_idx] = value
+
+    @property
+    def won_hist(self):
+        return self._won_hist if self.pool is None else self.pool.won_hist[self.pool_idx, :self.slot+1]
+
+    @won_hist.setter
+    def won_hist(self, value):
+        self._won_hist = value
+
     """
     calculate APY (with compound interest every epoch) every epoch scaled to runningtime
     @param rewards: rewards at each epoch
@@ -33,7 +69,7 @@ class Darkie():
             #init_stake = Num(self.initial_stake[idx-1]) if len(self.initial_stake)>=idx else Num(self.initial_stake[-1])
             current_epoch_staked_tokens = Num(self.strategy.staked_tokens_ratio[idx-1]) * Num(self.initial_stake[idx-1])
             avg_apy += (Num(reward) / current_epoch_staked_tokens) if current_epoch_staked_tokens!=0 else 0
-        return avg_apy * Num(ONE_YEAR/(self.slot/EPOCH_LENGTH)) if self.slot  and self.initial_stake[0]>0 >0 else 0
+        return avg_apy * Num(ONE_YEAR/(self.slot/EPOCH_LENGTH)) if self.slot and self.initial_stake[0]>0 else 0
 
     """
     calculate APR every epoch scaled to running time
@@ -134,6 +170,8 @@ class Darkie():
     play lottery if stakeholder won, update state
     """
     def run(self, hp=True):
+        # pooled darkies play through DarkiePool.run, won_hist is then a view of the pool history
+        assert self.pool is None, 'darkie {} is pooled, play through DarkiePool.run'.format(self.idx)
         k=N_TERM
         def target(tune_parameter, stake):
             x = (Num(1) if hp else 1)  - (Num(tune_parameter) if hp else tune_parameter)
@@ -145,18 +183,29 @@ class Darkie():
                 assert scaled_target>0
             return scaled_target
 
+        self.update_strategy()
+        T = target(self.f, self.strategy.staked_value(self.stake))
+        won, y = lottery(T, hp)
+        self.won_hist += [won]
+        return y, T
+    """
+    log apr every MIL_SLOT slots, set strategy staked ratio and epoch stake
+    at the start of every epoch.
+    """
+    def update_strategy(self):
+        is_mil_slot = (self.slot+1) % MIL_SLOT == 0
+        is_epoch_start = self.slot % EPOCH_LENGTH ==0 and self.slot > 0
+        if not (is_mil_slot or is_epoch_start):
+            return
         apr = self.apr_scaled_to_runningtime()
-        if (self.slot+1) % MIL_SLOT == 0:
+        if is_mil_slot:
             self.aprs += [apr]
-        if self.slot % EPOCH_LENGTH ==0 and self.slot > 0:
+        if is_epoch_start:
             # staked ratio is added in strategy
             self.strategy.set_ratio(self.slot, apr)
             # epoch stake is added
             self.initial_stake += [self.stake]
-        T = target(self.f, self.strategy.staked_value(self.stake))
-        won, y = lottery(T, hp)
-        self.won_hist += [won]
-        return y, T
+
     """
     update stake upon winning lottery with single lead
     """
@@ -190,17 +239,18 @@ class Darkie():
     anonymous contract assumed to be random stream from uniform distribution,
     naive emulation of smart contract based transactions with certain computational cost.
 
+    @param rng: numpy random generator, random module is used if not set
     @returns: transaction emulated as series of random floats between 0,1
     """
-    def tx(self, last_reward):
-        tx_size = random.randint(0, MAX_BLOCK_SIZE)
-        tip = self.tx_tip(tx_size, last_reward)
+    def tx(self, last_reward, rng=None):
+        tx_size = random.randint(0, MAX_BLOCK_SIZE) if rng is None else int(rng.integers(0, MAX_BLOCK_SIZE+1))
+        tip = self.tx_tip(tx_size, last_reward, rng)
         if self.stake < tip:
-            return Tx(tx_size, 0, self.idx)
-        return Tx(tx_size, tip, self.idx)
+            return Tx(tx_size, 0, self.idx, rng)
+        return Tx(tx_size, tip, self.idx, rng)
 
-    def tx_tip(self, tx_size, last_reward):
-        tip = random_tip_strategy()
+    def tx_tip(self, tx_size, last_reward, rng=None):
+        tip = random_tip_strategy(rng)
         apr = self.apr_scaled_to_runningtime()
         return tip.get_tip(float(last_reward), float(apr), tx_size, self.tips[-1])
 
@@ -218,9 +268,155 @@ class Darkie():
     def set_slashed(self):
         self.slashed = True
 
+'''
+structure of arrays for darkies stake, slot, and winning history,
+playing the lottery for all darkies at once.
+'''
+class DarkiePool():
+    def __init__(self, darkies, running_time, rng=None):
+        self.darkies = darkies
+        self.n = len(darkies)
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.stake = np.array([float(darkie.stake) for darkie in darkies], dtype=np.float64)
+        self.slots = np.array([darkie.slot for darkie in darkies], dtype=np.int64)
+        self.staked_ratio = np.array([darkie.strategy.staked_tokens_ratio[-1] for darkie in darkies], dtype=np.float64)
+        # running sum and count of staked ratios since genesis, for average staked ratio
+        self.staked_ratio_sum = np.array([float(sum(darkie.strategy.staked_tokens_ratio)) for darkie in darkies], dtype=np.float64)
+        self.staked_ratio_len = np.array([len(darkie.strategy.staked_tokens_ratio) for darkie in darkies], dtype=np.int64)
+        self.alive = np.ones(self.n, dtype=bool)
+        # winning history of all darkies, column major so every slot column is contiguous
+        self.won_hist = np.zeros((self.n, running_time), dtype=bool, order='F')
+        self.Sigma = None
+        self.feedback = None
+        self.f = None
+        self.slot = 0
+        # upcoming strategy update, and vesting slots
+        self.next_epoch = EPOCH_LENGTH
+        self.next_mil_slot = MIL_SLOT-1
+        self.next_vesting = VESTING_PERIOD
+        for pool_idx, darkie in enumerate(darkies):
+            darkie.pool = self
+            darkie.pool_idx = pool_idx
+
+    def set_sigma_feedback(self, sigma, feedback, f, count, hp=True):
+        self.Sigma = (Num(sigma) if hp else sigma)
+        self.feedback = (Num(feedback) if hp else feedback)
+        self.f = (Num(f) if hp else f)
+        self.slot = count
+        self.slots[self.alive] = count
+
+    """
+    update stake with vesting return for darkies at vesting period start
+    @returns: total vesting differential
+    """
+    def update_vesting(self):
+        if self.slot != self.next_vesting:
+            return 0
+        self.next_vesting += VESTING_PERIOD
+        return sum([self.darkies[i].update_vesting() for i in np.flatnonzero(self.alive)])
+
+    """
+    @param hp: high precision decimal option for sigmas
+    play lottery for all darkies, set slot winning column.
+    @returns: lottery y, T of darkies still playing
+    """
+    def run(self, hp=True):
+        k=N_TERM
+        if self.slot == self.next_mil_slot or self.slot == self.next_epoch:
+            if self.slot == self.next_mil_slot:
+                self.next_mil_slot += MIL_SLOT
+            if self.slot == self.next_epoch:
+                self.next_epoch += EPOCH_LENGTH
+            for i in np.flatnonzero(self.alive):
+                self.darkies[i].update_strategy()
+                staked_tokens_ratio = self.darkies[i].strategy.staked_tokens_ratio
+                self.staked_ratio[i] = staked_tokens_ratio[-1]
+                if len(staked_tokens_ratio) > self.staked_ratio_len[i]:
+                    self.staked_ratio_sum[i] += staked_tokens_ratio[-1]
+                    self.staked_ratio_len[i] = len(staked_tokens_ratio)
+        # sigmas are shared by all darkies, only stake differs.
+        x = (Num(1) if hp else 1) - self.f
+        c = (x.ln() if type(x)==Num else math.log(x))
+        sigmas = np.array([float(c/((self.Sigma+EPSILON)**i) * ((L_HP if hp else L)/fact(i))) for i in range(1, k+1)])
+        headstart = BASE_L if self.slot < HEADSTART_AIRDROP else 0.0
+        staked = self.staked_ratio * self.stake
+        y = self.rng.random(self.n) * L
+        won, T = lottery_vector(staked, sigmas, headstart, y)
+        assert np.all(T[staked>0] > 0)
+        self.won_hist[:, self.slot] = won & self.alive
+        return y[self.alive], T[self.alive]
+
+    def total_stake(self):
+        return self.stake[self.alive].sum()
+
+    """
+    @param rewards: epoch rewards
+    @returns: APY scaled to running time of darkies still playing
+    """
+    def apy_scaled_to_runningtime(self, rewards):
+        alive = np.flatnonzero(self.alive)
+        rewards = np.asarray(rewards, dtype=np.float64)
+        if len(alive)==0 or len(rewards)==0:
+            return np.zeros(len(alive))
+        # epoch reward relative to previous epoch staked tokens
+        prev_epoch = np.arange(len(rewards))-1
+        darkies = [self.darkies[i] for i in alive]
+        staked_tokens = np.array([np.asarray(darkie.strategy.staked_tokens_ratio, dtype=np.float64)[prev_epoch] * np.asarray(darkie.initial_stake, dtype=np.float64)[prev_epoch] for darkie in darkies])
+        apys = np.divide(rewards, staked_tokens, out=np.zeros_like(staked_tokens), where=staked_tokens!=0).sum(axis=1)
+        slot = self.slots[alive]
+        initial_stake = np.array([float(darkie.initial_stake[0]) for darkie in darkies], dtype=np.float64)
+        valid = (slot>0) & (initial_stake>0)
+        apys[valid] *= ONE_YEAR/(slot[valid]/EPOCH_LENGTH)
+        apys[~valid] = 0
+        return apys
+
+    """
+    @returns: APR since epoch stake scaled to running time of darkies still playing
+    """
+    def apr_scaled_to_runningtime(self):
+        alive = np.flatnonzero(self.alive)
+        initial_stake = np.array([float(self.darkies[i].initial_stake[-1]) for i in alive], dtype=np.float64)
+        stake = self.stake[alive]
+        slot = self.slots[alive]
+        apr_period = np.where(slot < HEADSTART_AIRDROP, slot%EPOCH_LENGTH, np.where(slot > MIL_SLOT, slot%MIL_SLOT, slot-HEADSTART_AIRDROP))
+        valid = (initial_stake>0) & (apr_period>0) & (slot>0)
+        aprs = np.zeros(len(alive))
+        aprs[valid] = ((stake[valid] - initial_stake[valid]) / initial_stake[valid]) / apr_period[valid] * ONE_YEAR
+        assert np.all(aprs[slot < HEADSTART_AIRDROP] >= 0), 'aprs: {}'.format(aprs[slot < HEADSTART_AIRDROP])
+        return aprs
+
+    """
+    @returns: average staked ratio from genesis of darkies still playing
+    """
+    def staked_tokens_ratio(self):
+        staked_ratios = self.staked_ratio_sum[self.alive] / self.staked_ratio_len[self.alive]
+        assert np.all((staked_ratios <= 1) & (staked_ratios >= 0)), 'staked_ratios: {}'.format(staked_ratios)
+        return staked_ratios
+
+    """
+    update stake upon winning lottery with single lead
+    """
+    def update_stake(self, i, reward):
+        if self.won_hist[i, self.slot]:
+            assert reward>=0
+            self.stake[i] += reward
+
+    """
+    update stakes after fork finalization
+    @param idxs: index of darkie winning every resynced slot
+    @param rewards: reward of every resynced slot
+    """
+    def resync_stake(self, idxs, rewards):
+        assert np.all(rewards>=0)
+        np.add.at(self.stake, idxs, rewards)
+
+    def slash(self, i):
+        self.alive[i] = False
+        self.darkies[i].set_slashed()
+
 class Tx(object):
-    def __init__(self, size, tip, idx):
-        self.tx = [random.random() for _ in range(size)]
+    def __init__(self, size, tip, idx, rng=None):
+        self.tx = [random.random() for _ in range(size)] if rng is None else rng.random(size).tolist()
         self.len = size
         self.tip = tip
         self.idx=idx
@@ -4,11 +4,9 @@ import time
 from datetime import timedelta
 from core.darkie import *
 from pid.cascade import *
-from tqdm import tqdm
-import random
 
 class DarkfiTable:
-    def __init__(self, airdrop, running_time, controller_type=CONTROLLER_TYPE_DISCRETE, kp=0, ki=0, kd=0, dt=1, kc=0, ti=0, td=0, ts=0, debug=False, r_kp=0, r_ki=0, r_kd=0, fee_kp=0, fee_ki=0, fee_kd=0):
+    def __init__(self, airdrop, running_time, controller_type=CONTROLLER_TYPE_DISCRETE, kp=0, ki=0, kd=0, dt=1, kc=0, ti=0, td=0, ts=0, debug=False, r_kp=0, r_ki=0, r_kd=0, fee_kp=0, fee_ki=0, fee_kd=0, seed=None):
         self.Sigma=airdrop
         self.darkies = {}
         self.running_time=running_time
@@ -22,12 +20,15 @@ class DarkfiTable:
         self.debug=debug
         self.rewards = []
         self.winners = [1]
+        self.since_last_single_win = 0 # trailing slots without single winner, before last slot
         self.computational_cost = [0]
         self.base_fee = []
         self.tips_avg = []
         self.cc_diff = []
         self.basefee = [FEE_MAX]
         self.slashed_idxs = []
+        # single generator shared by the table and darkies pool
+        self.rng = np.random.default_rng(seed)
 
     def add_darkie(self, darkie):
         self.darkies[darkie.idx] = darkie
@@ -45,51 +46,67 @@ class DarkfiTable:
         self.debug=debug
         self.start_time=time.time()
         # random running time
-        rand_running_time = random.randint(1,self.running_time) if rand_running_time else self.running_time
+        rand_running_time = int(self.rng.integers(1, self.running_time+1)) if rand_running_time else self.running_time
         self.running_time = rand_running_time
-        rt_range = tqdm(np.arange(0,self.running_time, 1))
+        self.pool = DarkiePool(list(self.darkies.values()), self.running_time, rng=self.rng)
+        # bind loop invariant lookups once
+        pool = self.pool
+        secondary_pid = self.secondary_pid
+        primary_pid = self.primary_pid
+        winners = self.winners
+        rewards_append = self.rewards.append
+        step = max(self.running_time//100, 1)
+        # progress is tracked manually, in batches of slots
+        pbar = tqdm(total=self.running_time, disable=not debug)
+        batch = max(self.running_time//1000, 1)
+        # upcoming epoch start, and log write slots
+        next_epoch = 0
+        next_write = step
         # loop through slots
-        for slot in rt_range:
+        for slot in range(self.running_time):
             # calculate probability of winning owning 100% of stake
-            f = self.secondary_pid.pid_clipped(float(self.winners[-1]), debug)
+            f = secondary_pid.pid_clipped(float(winners[-1]), debug)
             # calculate reward value every epoch
-            if slot%EPOCH_LENGTH == 0:
-                acc = self.secondary_pid.acc()
-                reward = self.primary_pid.pid_clipped(acc, debug)
-                self.rewards += [reward]
+            if slot == next_epoch:
+                next_epoch += EPOCH_LENGTH
+                acc = secondary_pid.acc()
+                reward = primary_pid.pid_clipped(acc, debug)
+                rewards_append(reward)
             #note! thread overhead is 10X slower than sequential node execution!
-            total_stake = 0
-            Ys = []
-            Ts = []
-            for key in self.darkies.keys():
-                self.darkies[key].set_sigma_feedback(self.Sigma, self.winners[-1], f, slot, hp)
-                diff = self.darkies[key].update_vesting()
-                self.Sigma += diff
-                y, T = self.darkies[key].run(hp)
-                Ys+=[y]
-                Ts+=[T]
-                total_stake += self.darkies[key].stake
+            pool.set_sigma_feedback(self.Sigma, winners[-1], f, slot, hp)
+            self.Sigma += pool.update_vesting()
+            Ys, Ts = pool.run(hp)
             # slot secondary controller feedback
-            self.winners += [sum([self.darkies[key].won_hist[-1] for key in self.darkies.keys()])]
-            if self.winners[-1]==1:
+            self.since_last_single_win = self.since_last_single_win+1 if winners[-1]!=1 else 0
+            winners.append(int(pool.won_hist[:, slot].sum()))
+            if winners[-1]==1:
                 is_slashed, idx = self.reward_slash_lead(slot, debug)
-                self.slashed_idxs += [idx]
+                self.slashed_idxs.append(idx)
                 if is_slashed==False:
                     self.resolve_fork(slot, debug)
-            avg_y = sum(Ys)/len(Ys)
-            avg_t = sum(Ts)/len(Ts)
-            avg_tip = self.tips_avg[-1] if len(self.tips_avg)>0 else 0
-            base_fee = self.base_fee[-1] if len(self.base_fee)>0 else 0
-            cc_diff = self.cc_diff[-1] if len(self.cc_diff)>0 else 0
-            rt_range.set_description('epoch: {}, fork: {}, winners: {}, issuance {} DRK, f: {}, acc: {}%, stake: {}%, sr: {}%, reward:{}, apr: {}%, basefee: {}, avg(fee): {}, cc_diff: {}, avg(y): {}, avg(T): {}'.format(int(slot/EPOCH_LENGTH), self.merge_length(), self.winners[-1], round(self.Sigma,2), round(f, 5), round(self.secondary_pid.acc()*100, 2), round(total_stake/self.Sigma*100 if self.Sigma>0 else 0,2), round(self.avg_stake_ratio()*100,2) , round(self.rewards[-1],2), round(self.avg_apr()*100,2), round(base_fee, 5),  round(avg_tip, 2), round(cc_diff, 5), round(float(avg_y), 2), round(float(avg_t), 2)))
-            #assert round(total_stake,1) <= round(self.Sigma,1), 'stake: {}, sigma: {}'.format(total_stake, self.Sigma)
+            # stake invariant is only checked in debug runs
+            if debug:
+                total_stake = pool.total_stake()
+                assert round(total_stake,1) <= round(self.Sigma,1), 'stake: {}, sigma: {}'.format(total_stake, self.Sigma)
             slot+=1
-            step = int(self.running_time/100)
-            if slot%step == 0 and slot>0:
+            # describe progress once every batch, reusing epoch accuracy
+            if debug and slot%batch == 0:
+                avg_y = Ys.mean() if len(Ys)>0 else 0
+                avg_t = Ts.mean() if len(Ts)>0 else 0
+                avg_tip = self.tips_avg[-1] if len(self.tips_avg)>0 else 0
+                base_fee = self.base_fee[-1] if len(self.base_fee)>0 else 0
+                cc_diff = self.cc_diff[-1] if len(self.cc_diff)>0 else 0
+                total_stake = pool.total_stake()
+                pbar.set_description('epoch: {}, fork: {}, winners: {}, issuance {} DRK, f: {}, acc: {}%, stake: {}%, sr: {}%, reward:{}, apr: {}%, basefee: {}, avg(fee): {}, cc_diff: {}, avg(y): {}, avg(T): {}'.format((slot-1)//EPOCH_LENGTH, self.since_last_single_win, winners[-1], round(self.Sigma,2), round(f, 5), round(acc*100, 2), round(total_stake/self.Sigma*100 if self.Sigma>0 else 0,2), round(self.avg_stake_ratio()*100,2) , round(self.rewards[-1],2), round(self.avg_apr()*100,2), round(base_fee, 5),  round(avg_tip, 2), round(cc_diff, 5), round(float(avg_y), 2), round(float(avg_t), 2)), refresh=False)
+                pbar.update(batch)
+            if slot == next_write:
+                next_write += step
                 self.end_time=time.time()
                 self.write()
                 self.start_time=time.time()
 
+        pbar.update(self.running_time%batch)
+        pbar.close()
         self.end_time=time.time()
         avg_reward = sum(self.rewards)/len(self.rewards)
         stake_ratio = self.avg_stake_ratio()
@@ -105,47 +122,44 @@ class DarkfiTable:
     """
     def reward_slash_lead(self, slot, debug=False):
         # reward the single lead
-        for key in self.darkies.keys():
-            if self.darkies[key].won_hist[-1]:
-                if random.random() < len(self.darkies)**-1:
-                    self.darkies.pop(key, None)
-                    print('stakeholder {} slashed'.format(key))
-                    return True, key
-                else:
-                    self.darkies[key].update_stake(self.rewards[-1])
-                    self.Sigma += self.rewards[-1]
-                    if slot > HEADSTART_AIRDROP:
-                        self.tx_fees(key, debug)
-                break
+        i = np.flatnonzero(self.pool.won_hist[:, slot])[0]
+        key = self.pool.darkies[i].idx
+        if self.rng.random() < len(self.darkies)**-1:
+            self.pool.slash(i)
+            self.darkies.pop(key, None)
+            print('stakeholder {} slashed'.format(key))
+            return True, key
+        self.pool.update_stake(i, self.rewards[-1])
+        self.Sigma += self.rewards[-1]
+        if slot > HEADSTART_AIRDROP:
+            self.tx_fees(key, debug)
         return False, -1
 
     """
-    resolve fork, for slots with multiple leads, shuffle nodes, and reward first winner.
+    resolve fork, for slots with multiple leads, reward a random winner.
     """
     def resolve_fork(self, slot, debug=False):
         # resolve fork
-        for i in range(self.merge_length()):
-            resync_slot_id = slot-(i+1)
-            resync_reward_id = int((resync_slot_id)/EPOCH_LENGTH)
-            resync_reward = self.rewards[resync_reward_id]
-            # resyncing depends on the random branch chosen,
-            # it's simulated by choosing first wining node
-            darkie_winning_idx = -1
-            keys_list = list(self.darkies.keys())
-            random.shuffle(keys_list)
-            for key in keys_list:
-                if self.darkies[key].won_hist[resync_slot_id]:
-                    self.darkies[key].resync_stake(resync_reward)
-                    self.Sigma += resync_reward
+        merge_length = self.merge_length()
+        if merge_length == 0:
+            return
+        resync_slot_ids = np.arange(slot-merge_length, slot)
+        resync_reward_ids = resync_slot_ids//EPOCH_LENGTH
+        first_reward_id = resync_reward_ids[0]
+        resync_rewards = np.array(self.rewards[first_reward_id:resync_reward_ids[-1]+1])[resync_reward_ids-first_reward_id]
+        # resyncing depends on the random branch chosen,
+        # it's simulated by choosing a random wining node of every slot
+        won = self.pool.won_hist[:, slot-merge_length:slot] & self.pool.alive[:, None]
+        has_winner = won.any(axis=0)
+        winning_idxs = (self.pool.rng.random(won.shape) * won).argmax(axis=0)[has_winner]
+        self.pool.resync_stake(winning_idxs, resync_rewards[has_winner])
+        self.Sigma += resync_rewards[has_winner].sum()
 
+    """
+    @returns: number of slots without single winner preceding last slot
+    """
     def merge_length(self):
-        merge_length = 0
-        for i in reversed(self.winners[:-1]):
-            if i !=1:
-                merge_length+=1
-            else:
-                break
-        return merge_length
+        return self.since_last_single_win
 
     """
     simulate general purpose transactions made by stakeholders,
@@ -155,7 +169,7 @@ class DarkfiTable:
         txs = []
         for key in self.darkies.keys():
             # make sure tip is covered by darkie stake
-            tx = self.darkies[key].tx(self.rewards[-1])
+            tx = self.darkies[key].tx(self.rewards[-1], self.rng)
             if self.darkies[key].stake > 0 and self.darkies[key].stake >=  (self.rewards[-1] + FEE_MAX):
                 assert tx.idx == self.darkies[key].idx
                 assert  key == tx.idx, 'key: {}, idx: {}'.format(key, tx.idx)
@@ -187,20 +201,20 @@ class DarkfiTable:
     @returns: average APY for all nodes
     """
     def avg_apy(self):
-        return Num(sum([self.darkies[key].apy_scaled_to_runningtime(self.rewards) for key in self.darkies.keys()])/len(self.darkies))
+        return Num(self.pool.apy_scaled_to_runningtime(self.rewards).mean())
 
     """
     average APR scaled to running time for all nodes
     @returns: average APR for all nodes
     """
     def avg_apr(self):
-        return Num(sum([self.darkies[key].apr_scaled_to_runningtime() for key in self.darkies.keys()])/len(self.darkies))
+        return Num(self.pool.apr_scaled_to_runningtime().mean())
 
     """
     returns: average stake ratio for all nodes
     """
     def avg_stake_ratio(self):
-        return sum([self.darkies[key].staked_tokens_ratio() for key in self.darkies.keys()]) / len(self.darkies)
+        return Num(self.pool.staked_tokens_ratio().mean())
 
     """
     write lottery reward log
@@ -212,9 +226,11 @@ class DarkfiTable:
         if self.debug:
             print("total time: {}, slot time: {}".format(str(timedelta(seconds=elapsed)), str(timedelta(seconds=elapsed/self.running_time))))
         self.secondary_pid.write()
-        with open('log/rewards.log', 'w+') as f:
-            buff = ','.join([str(i) for i in self.rewards])
-            f.write(buff)
+        np.save('log/rewards.npy', np.asarray(self.rewards, dtype=np.float64))
+        if self.debug:
+            with open('log/rewards.log', 'w+') as f:
+                buff = ','.join([str(i) for i in self.rewards])
+                f.write(buff)
 
     """
     tip auction
@@ -168,5 +168,6 @@ class Generous(Tip):
         return last_tip*2
 
 
-def random_tip_strategy():
-    return random.choice([ZeroTip(), RewardApr(),   MilthOfReward(),  MilthCCApr(), Conservative(), Generous()])
+def random_tip_strategy(rng=None):
+    tips = [ZeroTip(), RewardApr(),   MilthOfReward(),  MilthCCApr(), Conservative(), Generous()]
+    return random.choice(tips) if rng is None else tips[rng.integers(len(tips))]
@@ -3,6 +3,11 @@ import math
 import numpy as np
 from core.constants import *
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # naive factorial
 def fact(n, hp=False):
     assert (n>0)
@@ -46,3 +51,24 @@ def lottery(T, hp=False, log=False):
             f.write(lottery_line)
     won = y < T if y is not None and T is not None else False
     return won, y
+
+"""
+approximate ouroboros phi target for every stakeholder,
+and play the lottery against given draws.
+@param staked: staked value of every stakeholder
+@param sigmas: n sigmas of n-term approximation of phi target function
+@param headstart: headstart value added to target
+@param y: lottery draw of every stakeholder
+@returns: winning vector, target values T
+"""
+def lottery_vector(staked, sigmas, headstart, y):
+    # horner evaluation of target polynomial
+    target = np.zeros_like(staked)
+    for i in range(sigmas.shape[0]-1, -1, -1):
+        target = (target + sigmas[i]) * staked
+    T = headstart - target
+    return y < T, T
+
+if njit is not None:
+    # compiled when numba is available
+    lottery_vector = njit(cache=True)(lottery_vector)
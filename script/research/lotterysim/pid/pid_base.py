@@ -122,7 +122,7 @@ class BasePID:
         self.write_fval('log'+ os.sep + self.type+output_hist_file)
 
     def acc(self, window=ACC_WINDOW):
-        windowed_hist = [round(hist, 2) for hist in self.feedback_hist][-1*window:]
+        windowed_hist = [round(hist, 2) for hist in self.feedback_hist[-1*window:]]
         return sum(np.array(windowed_hist)==self.target)/float(len(windowed_hist))
 
     def acc_percentage(self):
@@ -11,7 +11,7 @@ import os
 logging.basicConfig(filename='log/vesting.log', encoding='utf-8', level=logging.DEBUG)
 
 def vesting_instance(vesting, running_time):
-    os.system("rm log/*_feedback.hist; rm log/*_output.hist log/darkie* log/rewards.log")
+    os.system("rm log/*_feedback.hist; rm log/*_output.hist log/darkie* log/rewards.log log/rewards.npy")
     native_drk = ERC20DRK * config.exchange_rate
     total_vesting = 0
     if __name__ == "__main__":